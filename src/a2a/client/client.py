@@ -40,7 +40,10 @@ class ClientConfig:
     polling loop."""
 
     httpx_client: httpx.AsyncClient | None = None
-    """Http client to use to connect to agent."""
+    """Http client to use to connect to agent. If unset, every client created
+    by the factory opens its own `httpx.AsyncClient`; set a shared instance
+    to reuse its keep-alive connection pool across clients. Closing a client
+    also closes its http client."""
 
     grpc_channel_factory: Callable[[str], Channel] | None = None
     """Generates a grpc connection channel for a given url."""
@@ -205,11 +205,15 @@ class JSONRPCApplication(ABC):
                 'AgentCard.supports_authenticated_extended_card is True, but no extended_agent_card was provided. The /agent/authenticatedExtendedCard endpoint will return 404.'
             )
         self._context_builder = context_builder or DefaultCallContextBuilder()
+        # Serialized public agent card, populated on first request when no
+        # card_modifier is configured, and the card object it was built from.
+        self._agent_card_body: bytes | None = None
+        self._agent_card_body_source: AgentCard | None = None
 
     def _generate_error_response(
         self, request_id: str | int | None, error: JSONRPCError | A2AError
-    ) -> JSONResponse:
-        """Creates a Starlette JSONResponse for a JSON-RPC error.
+    ) -> Response:
+        """Creates a Starlette Response for a JSON-RPC error.
 
         Logs the error based on its type.
 
@@ -218,7 +222,7 @@ class JSONRPCApplication(ABC):
             error: The `JSONRPCError` or `A2AError` object.
 
         Returns:
-            A `JSONResponse` object formatted as a JSON-RPC error response.
+            A JSON `Response` object formatted as a JSON-RPC error response.
         """
         error_resp = JSONRPCErrorResponse(
             id=request_id,
@@ -237,9 +241,10 @@ class JSONRPCApplication(ABC):
             f"Code={error_resp.error.code}, Message='{error_resp.error.message}'"
             f'{", Data=" + str(error_resp.error.data) if error_resp.error.data else ""}',
         )
-        return JSONResponse(
-            error_resp.model_dump(mode='json', exclude_none=True),
+        return Response(
+            error_resp.model_dump_json(exclude_none=True),
             status_code=200,
+            media_type='application/json',
         )
 
     async def _handle_requests(self, request: Request) -> Response:  # noqa: PLR0911
@@ -254,7 +259,8 @@ class JSONRPCApplication(ABC):
             request: The incoming Starlette Request object.
 
         Returns:
-            A Starlette Response object (JSONResponse or EventSourceResponse).
+            A Starlette Response object (a JSON Response or an
+            EventSourceResponse).
 
         Raises:
             (Implicitly handled): Various exceptions are caught and converted
@@ -368,7 +374,7 @@ class JSONRPCApplication(ABC):
             context: The ServerCallContext for the request.
 
         Returns:
-            A `JSONResponse` object containing the result or error.
+            A JSON `Response` object containing the result or error.
         """
         request_obj = a2a_request.root
         handler_result: Any = None
@@ -456,7 +462,9 @@ class JSONRPCApplication(ABC):
                 async generator for streaming or a Pydantic model for non-streaming.
 
         Returns:
-            A Starlette JSONResponse or EventSourceResponse.
+            A Starlette Response or EventSourceResponse. JSON bodies are
+            encoded directly by Pydantic's `model_dump_json` rather than
+            dumped to a dict and re-encoded with `json.dumps`.
         """
         headers = {}
         if exts := context.activated_extensions:
@@ -473,27 +481,30 @@ class JSONRPCApplication(ABC):
                 event_generator(handler_result), headers=headers
             )
         if isinstance(handler_result, JSONRPCErrorResponse):
-            return JSONResponse(
-                handler_result.model_dump(
-                    mode='json',
-                    exclude_none=True,
-                ),
+            return Response(
+                handler_result.model_dump_json(exclude_none=True),
                 headers=headers,
+                media_type='application/json',
             )
 
-        return JSONResponse(
-            handler_result.root.model_dump(mode='json', exclude_none=True),
+        return Response(
+            handler_result.root.model_dump_json(exclude_none=True),
             headers=headers,
+            media_type='application/json',
         )
 
-    async def _handle_get_agent_card(self, request: Request) -> JSONResponse:
+    async def _handle_get_agent_card(self, request: Request) -> Response:
         """Handles GET requests for the agent card endpoint.
 
+        Without a `card_modifier` the card is serialized once and the cached
+        body is reused until `agent_card` is reassigned. Mutating the card in
+        place is not detected; assign a new card (or build a new app) instead.
+
         Args:
             request: The incoming Starlette Request object.
 
         Returns:
-            A JSONResponse containing the agent card data.
+            A Response containing the agent card data as JSON.
         """
         if request.url.path == PREV_AGENT_CARD_WELL_KNOWN_PATH:
             logger.warning(
@@ -501,16 +512,26 @@ class JSONRPCApplication(ABC):
                 f"Please use '{AGENT_CARD_WELL_KNOWN_PATH}' instead. This endpoint will be removed in a future version."
             )
 
-        card_to_serve = self.agent_card
         if self.card_modifier:
-            card_to_serve = self.card_modifier(card_to_serve)
+            card_to_serve = self.card_modifier(self.agent_card)
+            return Response(
+                card_to_serve.model_dump_json(
+                    exclude_none=True,
+                    by_alias=True,
+                ),
+                media_type='application/json',
+            )
 
-        return JSONResponse(
-            card_to_serve.model_dump(
+        if (
+            self._agent_card_body is None
+            or self._agent_card_body_source is not self.agent_card
+        ):
+            self._agent_card_body = self.agent_card.model_dump_json(
                 exclude_none=True,
                 by_alias=True,
-            )
-        )
+            ).encode()
+            self._agent_card_body_source = self.agent_card
+        return Response(self._agent_card_body, media_type='application/json')
 
     async def _handle_get_authenticated_extended_agent_card(
         self, request: Request
@@ -49,12 +49,14 @@ class EventQueue:
         Args:
             event: The event object to enqueue.
         """
-        async with self._lock:
-            if self._is_closed:
-                logger.warning('Queue is closed. Event will not be enqueued.')
-                return
+        # No lock is needed to read the closed flag: nothing awaits between
+        # this check and the put below, and `close` flips the flag without
+        # awaiting either, so a per-event lock acquisition buys nothing.
+        if self._is_closed:
+            logger.warning('Queue is closed. Event will not be enqueued.')
+            return
 
-        logger.debug(f'Enqueuing event of type: {type(event)}')
+        logger.debug('Enqueuing event of type: %s', type(event))
 
         # Make sure to use put instead of put_nowait to avoid blocking the event loop.
         await self.queue.put(event)
@@ -89,22 +91,21 @@ class EventQueue:
             asyncio.QueueEmpty: If `no_wait` is True and the queue is empty.
             asyncio.QueueShutDown: If the queue has been closed and is empty.
         """
-        async with self._lock:
-            if self._is_closed and self.queue.empty():
-                logger.warning('Queue is closed. Event will not be dequeued.')
-                raise asyncio.QueueEmpty('Queue is closed.')
+        if self._is_closed and self.queue.empty():
+            logger.warning('Queue is closed. Event will not be dequeued.')
+            raise asyncio.QueueEmpty('Queue is closed.')
 
         if no_wait:
             logger.debug('Attempting to dequeue event (no_wait=True).')
             event = self.queue.get_nowait()
             logger.debug(
-                f'Dequeued event (no_wait=True) of type: {type(event)}'
+                'Dequeued event (no_wait=True) of type: %s', type(event)
             )
             return event
 
         logger.debug('Attempting to dequeue event (waiting).')
         event = await self.queue.get()
-        logger.debug(f'Dequeued event (waited) of type: {type(event)}')
+        logger.debug('Dequeued event (waited) of type: %s', type(event))
         return event
 
     def task_done(self) -> None:
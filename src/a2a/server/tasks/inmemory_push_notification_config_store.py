@@ -19,8 +19,11 @@ class InMemoryPushNotificationConfigStore(PushNotificationConfigStore):
     def __init__(self) -> None:
         """Initializes the InMemoryPushNotificationConfigStore."""
         self.lock = asyncio.Lock()
+        # Configurations are keyed by task id, then by config id, so that
+        # replacing or deleting a single config is a dict lookup rather than
+        # a scan over every config registered for the task.
         self._push_notification_infos: dict[
-            str, list[PushNotificationConfig]
+            str, dict[str, PushNotificationConfig]
         ] = {}
 
     async def set_info(
@@ -28,23 +31,22 @@ class InMemoryPushNotificationConfigStore(PushNotificationConfigStore):
     ) -> None:
         """Sets or updates the push notification configuration for a task in memory."""
         async with self.lock:
-            if task_id not in self._push_notification_infos:
-                self._push_notification_infos[task_id] = []
+            configurations = self._push_notification_infos.setdefault(
+                task_id, {}
+            )
 
             if notification_config.id is None:
                 notification_config.id = task_id
 
-            for config in self._push_notification_infos[task_id]:
-                if config.id == notification_config.id:
-                    self._push_notification_infos[task_id].remove(config)
-                    break
-
-            self._push_notification_infos[task_id].append(notification_config)
+            # Pop before inserting so an updated config moves to the end.
+            configurations.pop(notification_config.id, None)
+            configurations[notification_config.id] = notification_config
 
     async def get_info(self, task_id: str) -> list[PushNotificationConfig]:
         """Retrieves the push notification configuration for a task from memory."""
         async with self.lock:
-            return self._push_notification_infos.get(task_id) or []
+            configurations = self._push_notification_infos.get(task_id)
+            return list(configurations.values()) if configurations else []
 
     async def delete_info(
         self, task_id: str, config_id: str | None = None
@@ -54,15 +56,11 @@ class InMemoryPushNotificationConfigStore(PushNotificationConfigStore):
             if config_id is None:
                 config_id = task_id
 
-            if task_id in self._push_notification_infos:
-                configurations = self._push_notification_infos[task_id]
-                if not configurations:
-                    return
+            configurations = self._push_notification_infos.get(task_id)
+            if not configurations:
+                return
 
-                for config in configurations:
-                    if config.id == config_id:
-                        configurations.remove(config)
-                        break
+            configurations.pop(config_id, None)
 
-                if len(configurations) == 0:
-                    del self._push_notification_infos[task_id]
+            if not configurations:
+                del self._push_notification_infos[task_id]
@@ -110,4 +110,9 @@ def get_message_text(message: Message, delimiter: str = '\n') -> str:
     Returns:
         A single string containing all text content, or an empty string if no text parts are found.
     """
-    return delimiter.join(get_text_parts(message.parts))
+    parts = message.parts
+    if len(parts) == 1:
+        # Common case: a single part needs no intermediate list or join.
+        part = parts[0].root
+        return part.text if isinstance(part, TextPart) else ''
+    return delimiter.join(get_text_parts(parts))
@@ -1,9 +1,10 @@
-from unittest.mock import AsyncMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from a2a.client.transports.grpc import GrpcTransport
-from a2a.grpc import a2a_pb2, a2a_pb2_grpc
+from a2a.grpc import a2a_pb2
 from a2a.types import (
     AgentCapabilities,
     AgentCard,
@@ -23,19 +24,24 @@ from a2a.utils import get_text_parts, proto_utils
 
 # Fixtures
 @pytest.fixture
-def mock_grpc_stub() -> AsyncMock:
-    """Provides a mock gRPC stub with methods mocked."""
-    stub = AsyncMock(spec=a2a_pb2_grpc.A2AServiceStub)
-    stub.SendMessage = AsyncMock()
-    stub.SendStreamingMessage = AsyncMock()
-    stub.GetTask = AsyncMock()
-    stub.CancelTask = AsyncMock()
-    stub.CreateTaskPushNotification = AsyncMock()
-    stub.GetTaskPushNotification = AsyncMock()
-    return stub
+def mock_grpc_stub() -> SimpleNamespace:
+    """Provides a mock gRPC stub with methods mocked.
+
+    A plain namespace is used instead of `AsyncMock(spec=A2AServiceStub)`
+    because the transport only calls these attributes, and building a
+    spec'd mock introspects the whole generated stub class for every test.
+    """
+    return SimpleNamespace(
+        SendMessage=AsyncMock(),
+        SendStreamingMessage=MagicMock(),
+        GetTask=AsyncMock(),
+        CancelTask=AsyncMock(),
+        CreateTaskPushNotification=AsyncMock(),
+        GetTaskPushNotification=AsyncMock(),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def sample_agent_card() -> AgentCard:
     """Provides a minimal agent card for initialization."""
     return AgentCard(
@@ -52,7 +58,7 @@ def sample_agent_card() -> AgentCard:
 
 @pytest.fixture
 def grpc_transport(
-    mock_grpc_stub: AsyncMock, sample_agent_card: AgentCard
+    mock_grpc_stub: SimpleNamespace, sample_agent_card: AgentCard
 ) -> GrpcTransport:
     """Provides a GrpcTransport instance."""
     channel = AsyncMock()
@@ -61,7 +67,7 @@ def grpc_transport(
     return transport
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def sample_message_send_params() -> MessageSendParams:
     """Provides a sample MessageSendParams object."""
     return MessageSendParams(
@@ -73,7 +79,7 @@ def sample_message_send_params() -> MessageSendParams:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def sample_task() -> Task:
     """Provides a sample Task object."""
     return Task(
@@ -83,7 +89,7 @@ def sample_task() -> Task:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def sample_message() -> Message:
     """Provides a sample Message object."""
     return Message(
@@ -93,16 +99,29 @@ def sample_message() -> Message:
     )
 
 
+@pytest.fixture(scope='module')
+def sample_task_proto(sample_task: Task) -> a2a_pb2.Task:
+    """Provides the protobuf form of the sample Task, converted once."""
+    return proto_utils.ToProto.task(sample_task)
+
+
+@pytest.fixture(scope='module')
+def sample_message_proto(sample_message: Message) -> a2a_pb2.Message:
+    """Provides the protobuf form of the sample Message, converted once."""
+    return proto_utils.ToProto.message(sample_message)
+
+
 @pytest.mark.asyncio
 async def test_send_message_task_response(
     grpc_transport: GrpcTransport,
-    mock_grpc_stub: AsyncMock,
+    mock_grpc_stub: SimpleNamespace,
     sample_message_send_params: MessageSendParams,
     sample_task: Task,
+    sample_task_proto: a2a_pb2.Task,
 ):
     """Test send_message that returns a Task."""
     mock_grpc_stub.SendMessage.return_value = a2a_pb2.SendMessageResponse(
-        task=proto_utils.ToProto.task(sample_task)
+        task=sample_task_proto
     )
 
     response = await grpc_transport.send_message(sample_message_send_params)
@@ -115,13 +134,14 @@ async def test_send_message_task_response(
 @pytest.mark.asyncio
 async def test_send_message_message_response(
     grpc_transport: GrpcTransport,
-    mock_grpc_stub: AsyncMock,
+    mock_grpc_stub: SimpleNamespace,
     sample_message_send_params: MessageSendParams,
     sample_message: Message,
+    sample_message_proto: a2a_pb2.Message,
 ):
     """Test send_message that returns a Message."""
     mock_grpc_stub.SendMessage.return_value = a2a_pb2.SendMessageResponse(
-        msg=proto_utils.ToProto.message(sample_message)
+        msg=sample_message_proto
     )
 
     response = await grpc_transport.send_message(sample_message_send_params)
@@ -135,48 +155,38 @@ async def test_send_message_message_response(
 
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize('history_length', [None, 10])
 async def test_get_task(
-    grpc_transport: GrpcTransport, mock_grpc_stub: AsyncMock, sample_task: Task
+    grpc_transport: GrpcTransport,
+    mock_grpc_stub: SimpleNamespace,
+    sample_task: Task,
+    sample_task_proto: a2a_pb2.Task,
+    history_length: int | None,
 ):
-    """Test retrieving a task."""
-    mock_grpc_stub.GetTask.return_value = proto_utils.ToProto.task(sample_task)
-    params = TaskQueryParams(id=sample_task.id)
+    """Test retrieving a task, with and without a history length."""
+    mock_grpc_stub.GetTask.return_value = sample_task_proto
+    params = TaskQueryParams(id=sample_task.id, history_length=history_length)
 
     response = await grpc_transport.get_task(params)
 
     mock_grpc_stub.GetTask.assert_awaited_once_with(
         a2a_pb2.GetTaskRequest(
-            name=f'tasks/{sample_task.id}', history_length=None
+            name=f'tasks/{sample_task.id}', history_length=history_length
         )
     )
     assert response.id == sample_task.id
 
 
-@pytest.mark.asyncio
-async def test_get_task_with_history(
-    grpc_transport: GrpcTransport, mock_grpc_stub: AsyncMock, sample_task: Task
-):
-    """Test retrieving a task with history."""
-    mock_grpc_stub.GetTask.return_value = proto_utils.ToProto.task(sample_task)
-    history_len = 10
-    params = TaskQueryParams(id=sample_task.id, history_length=history_len)
-
-    await grpc_transport.get_task(params)
-
-    mock_grpc_stub.GetTask.assert_awaited_once_with(
-        a2a_pb2.GetTaskRequest(
-            name=f'tasks/{sample_task.id}', history_length=history_len
-        )
-    )
-
-
 @pytest.mark.asyncio
 async def test_cancel_task(
-    grpc_transport: GrpcTransport, mock_grpc_stub: AsyncMock, sample_task: Task
+    grpc_transport: GrpcTransport,
+    mock_grpc_stub: SimpleNamespace,
+    sample_task: Task,
 ):
     """Test cancelling a task."""
-    cancelled_task = sample_task.model_copy()
-    cancelled_task.status.state = TaskState.canceled
+    cancelled_task = sample_task.model_copy(
+        update={'status': TaskStatus(state=TaskState.canceled)}
+    )
     mock_grpc_stub.CancelTask.return_value = proto_utils.ToProto.task(
         cancelled_task
     )
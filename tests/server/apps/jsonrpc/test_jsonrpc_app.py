@@ -1,5 +1,5 @@
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -26,6 +26,7 @@ from a2a.server.request_handlers.request_handler import (
     RequestHandler,
 )  # For mock spec
 from a2a.types import (
+    AgentCapabilities,
     AgentCard,
     Message,
     MessageSendParams,
@@ -36,6 +37,7 @@ from a2a.types import (
     SendMessageSuccessResponse,
     TextPart,
 )
+from a2a.utils.constants import AGENT_CARD_WELL_KNOWN_PATH
 
 
 # --- StarletteUserProxy Tests ---
@@ -356,5 +358,77 @@ class TestJSONRPCExtensions:
         }
 
 
+class TestJSONRPCAgentCardEndpoint:
+    @pytest.fixture
+    def agent_card(self) -> AgentCard:
+        return AgentCard(
+            name='TestAgent',
+            description='Test Agent',
+            url='http://example.com/agent',
+            version='1.0',
+            capabilities=AgentCapabilities(),
+            default_input_modes=['text/plain'],
+            default_output_modes=['text/plain'],
+            skills=[],
+        )
+
+    def test_agent_card_is_serialized_once(self, agent_card: AgentCard):
+        app = A2AStarletteApplication(agent_card, AsyncMock())
+        client = TestClient(app.build())
+
+        with patch.object(
+            AgentCard,
+            'model_dump_json',
+            autospec=True,
+            side_effect=AgentCard.model_dump_json,
+        ) as mock_dump:
+            first = client.get(AGENT_CARD_WELL_KNOWN_PATH)
+            second = client.get(AGENT_CARD_WELL_KNOWN_PATH)
+
+        assert mock_dump.call_count == 1
+        assert first.status_code == 200
+        assert first.headers['content-type'] == 'application/json'
+        assert first.content == second.content
+        assert first.json() == agent_card.model_dump(
+            mode='json', exclude_none=True, by_alias=True
+        )
+
+    def test_agent_card_reassignment_invalidates_cache(
+        self, agent_card: AgentCard
+    ):
+        app = A2AStarletteApplication(agent_card, AsyncMock())
+        client = TestClient(app.build())
+
+        assert client.get(AGENT_CARD_WELL_KNOWN_PATH).json()['name'] == (
+            'TestAgent'
+        )
+        app.agent_card = agent_card.model_copy(update={'name': 'Renamed'})
+        assert client.get(AGENT_CARD_WELL_KNOWN_PATH).json()['name'] == (
+            'Renamed'
+        )
+
+    def test_agent_card_with_modifier_is_not_cached(
+        self, agent_card: AgentCard
+    ):
+        calls = 0
+
+        def modifier(card: AgentCard) -> AgentCard:
+            nonlocal calls
+            calls += 1
+            return card.model_copy(update={'name': f'Modified {calls}'})
+
+        app = A2AStarletteApplication(
+            agent_card, AsyncMock(), card_modifier=modifier
+        )
+        client = TestClient(app.build())
+
+        assert client.get(AGENT_CARD_WELL_KNOWN_PATH).json()['name'] == (
+            'Modified 1'
+        )
+        assert client.get(AGENT_CARD_WELL_KNOWN_PATH).json()['name'] == (
+            'Modified 2'
+        )
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
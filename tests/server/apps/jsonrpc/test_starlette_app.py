@@ -1,14 +1,10 @@
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock
 
 import pytest
 
 from a2a.server.apps.jsonrpc import starlette_app
 from a2a.server.apps.jsonrpc.starlette_app import A2AStarletteApplication
-from a2a.server.request_handlers.request_handler import (
-    RequestHandler,  # For mock spec
-)
-from a2a.types import AgentCard  # For mock spec
 
 
 # --- A2AStarletteApplication Tests ---
@@ -33,15 +29,14 @@ class TestA2AStarletteApplicationOptionalDeps:
 
     @pytest.fixture(scope='class')
     def mock_app_params(self) -> dict:
-        # Mock http_handler
-        mock_handler = MagicMock(spec=RequestHandler)
-        # Mock agent_card with essential attributes accessed in __init__
-        mock_agent_card = MagicMock(spec=AgentCard)
-        # Ensure 'url' attribute exists on the mock_agent_card, as it's accessed
-        # in __init__
-        mock_agent_card.url = 'http://example.com'
-        # Ensure 'supports_authenticated_extended_card' attribute exists
-        mock_agent_card.supports_authenticated_extended_card = False
+        # The application only stores the handler and reads these two card
+        # attributes in __init__, so plain namespaces stand in for spec'd
+        # mocks of the (large) RequestHandler and AgentCard classes.
+        mock_handler = SimpleNamespace()
+        mock_agent_card = SimpleNamespace(
+            url='http://example.com',
+            supports_authenticated_extended_card=False,
+        )
         return {'agent_card': mock_agent_card, 'http_handler': mock_handler}
 
     @pytest.fixture(scope='class')
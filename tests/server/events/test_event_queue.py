@@ -233,10 +233,9 @@ async def test_dequeue_event_closed_and_empty_waits_then_raises(
     # If closed and empty, it raises QueueEmpty immediately.
     # The "waits_then_raises" scenario described in the subtask implies the `get()` might wait.
     # However, the current code:
-    # async with self._lock:
-    #     if self._is_closed and self.queue.empty():
-    #         logger.warning('Queue is closed. Event will not be dequeued.')
-    #         raise asyncio.QueueEmpty('Queue is closed.')
+    # if self._is_closed and self.queue.empty():
+    #     logger.warning('Queue is closed. Event will not be dequeued.')
+    #     raise asyncio.QueueEmpty('Queue is closed.')
     # event = await self.queue.get() -> this line is not reached if closed and empty.
 
     # So, for the current implementation, it will raise QueueEmpty immediately.
@@ -50,7 +50,8 @@ class TestInMemoryPushNotifier(unittest.IsolatedAsyncioTestCase):
 
         self.assertIn(task_id, self.config_store._push_notification_infos)
         self.assertEqual(
-            self.config_store._push_notification_infos[task_id], [config]
+            list(self.config_store._push_notification_infos[task_id].values()),
+            [config],
         )
 
     async def test_set_info_appends_to_existing_config(self):
@@ -66,14 +67,11 @@ class TestInMemoryPushNotifier(unittest.IsolatedAsyncioTestCase):
         await self.config_store.set_info(task_id, updated_config)
 
         self.assertIn(task_id, self.config_store._push_notification_infos)
-        self.assertEqual(
-            self.config_store._push_notification_infos[task_id][0],
-            initial_config,
-        )
-        self.assertEqual(
-            self.config_store._push_notification_infos[task_id][1],
-            updated_config,
+        configs = list(
+            self.config_store._push_notification_infos[task_id].values()
         )
+        self.assertEqual(configs[0], initial_config)
+        self.assertEqual(configs[1], updated_config)
 
     async def test_set_info_without_config_id(self):
         task_id = 'task1'
@@ -82,9 +80,8 @@ class TestInMemoryPushNotifier(unittest.IsolatedAsyncioTestCase):
         )
         await self.config_store.set_info(task_id, initial_config)
 
-        assert (
-            self.config_store._push_notification_infos[task_id][0].id == task_id
-        )
+        configs = self.config_store._push_notification_infos[task_id]
+        assert configs[task_id].id == task_id
 
         updated_config = PushNotificationConfig(
             url='http://initial.url/callback_new'
@@ -94,7 +91,7 @@ class TestInMemoryPushNotifier(unittest.IsolatedAsyncioTestCase):
         self.assertIn(task_id, self.config_store._push_notification_infos)
         assert len(self.config_store._push_notification_infos[task_id]) == 1
         self.assertEqual(
-            self.config_store._push_notification_infos[task_id][0].url,
+            self.config_store._push_notification_infos[task_id][task_id].url,
             updated_config.url,
         )
 
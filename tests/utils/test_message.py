@@ -382,3 +382,17 @@ class TestGetMessageText:
 
         # Verify
         assert result == ''
+
+    def test_get_message_text_single_non_text_part(self):
+        # Setup
+        message = Message(
+            role=Role.agent,
+            parts=[Part(root=DataPart(data={'key': 'value'}))],
+            message_id='test-message-id',
+        )
+
+        # Exercise
+        result = get_message_text(message)
+
+        # Verify
+        assert result == ''